@@ -122,6 +122,8 @@ async def get_live_data(unit_id: str) -> Dict:
     if preferences:
         from app.services.data_resolver import get_data_resolver
 
+        # Live snapshots are shared with the unit manager; overlay resolved values on a copy.
+        data = dict(data)
         resolver = get_data_resolver()
         resolved = resolver.resolve_all(
             unit_id=unit_id,
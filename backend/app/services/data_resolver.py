@@ -13,10 +13,12 @@ Default compatibility behavior:
 import logging
 import math
 import re
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +53,13 @@ QUALITY_META = {
 }
 
 
-@dataclass
+def _utc_now_iso() -> str:
+    """UTC ISO-8601 timestamp with microseconds, without building a datetime."""
+    now = time.time()
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now * 1_000_000) % 1_000_000:06d}"
+
+
+@dataclass(slots=True)
 class ResolveResult:
     parameter: str
     value: Optional[float]
@@ -64,22 +72,41 @@ class ResolveResult:
 class StaleDataTracker:
     """Tracks value changes to detect frozen/zombie sensors."""
 
+    __slots__ = (
+        "staleness_minutes",
+        "change_threshold",
+        "_staleness_ns",
+        "_dynamic",
+        "last_values",
+        "last_change_times",
+    )
+
     def __init__(self, staleness_minutes: float = 5.0, change_threshold: float = 0.01):
         self.staleness_minutes = staleness_minutes
         self.change_threshold = change_threshold
+        self._staleness_ns = int(staleness_minutes * 60 * 1_000_000_000)
+        # Parameter names never change class, so the keyword scan runs once per name.
+        self._dynamic: Dict[str, bool] = {}
         self.last_values: Dict[str, float] = {}
-        self.last_change_times: Dict[str, datetime] = {}
+        # Monotonic nanosecond timestamps of the last significant change.
+        self.last_change_times: Dict[str, int] = {}
 
     def is_dynamic(self, parameter: str) -> bool:
-        return any(kw in parameter.lower() for kw in DYNAMIC_KEYWORDS)
+        dynamic = self._dynamic.get(parameter)
+        if dynamic is None:
+            lowered = parameter.lower()
+            dynamic = any(kw in lowered for kw in DYNAMIC_KEYWORDS)
+            self._dynamic[sys.intern(parameter)] = dynamic
+        return dynamic
 
     def is_stale(self, parameter: str, value: float) -> bool:
         if not self.is_dynamic(parameter):
             return False
 
-        now = datetime.utcnow()
+        now = time.monotonic_ns()
         prev = self.last_values.get(parameter)
         if prev is None:
+            parameter = sys.intern(parameter)
             self.last_values[parameter] = value
             self.last_change_times[parameter] = now
             return False
@@ -90,8 +117,7 @@ class StaleDataTracker:
             return False
 
         last_change = self.last_change_times.get(parameter, now)
-        elapsed_min = (now - last_change).total_seconds() / 60.0
-        return elapsed_min >= self.staleness_minutes
+        return now - last_change >= self._staleness_ns
 
 
 class DataResolver:
@@ -131,6 +157,8 @@ class DataResolver:
         "stg3_discharge_pressure": ["stg3_discharge_press"],
     }
 
+    __slots__ = ("stale_tracker", "manual_values")
+
     def __init__(self):
         self.stale_tracker = StaleDataTracker(staleness_minutes=5.0, change_threshold=0.01)
         self.manual_values: Dict[str, Dict[str, Dict[str, Any]]] = {}
@@ -138,12 +166,14 @@ class DataResolver:
     def set_manual_value(self, unit_id: str, parameter: str, value: float, expires_at: datetime = None):
         if unit_id not in self.manual_values:
             self.manual_values[unit_id] = {}
+        parameter = sys.intern(parameter)
         self.manual_values[unit_id][parameter] = {
             "value": float(value),
             "set_at": datetime.utcnow(),
             "expires_at": expires_at,
         }
-        logger.debug("Manual override set: %s.%s = %s", unit_id, parameter, value)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Manual override set: %s.%s = %s", unit_id, parameter, value)
 
     def clear_manual_value(self, unit_id: str, parameter: str):
         unit_manual = self.manual_values.get(unit_id, {})
@@ -230,6 +260,27 @@ class DataResolver:
             return False
         return True
 
+    # Calculator constants are only parsed by the handlers that consume them.
+    def _cooler_approach_f(self, live_data: Dict[str, Any], config: Dict[str, Any]) -> float:
+        cooler_approach_f = self._to_float(config.get("coolerApproachF", config.get("cooler_approach_f")))
+        if cooler_approach_f is None:
+            cooler_approach_f = self._to_float(live_data.get("cooler_approach_f"))
+        if cooler_approach_f is None:
+            cooler_approach_f = 15.0
+        return cooler_approach_f
+
+    def _interstage_dp(self, config: Dict[str, Any]) -> float:
+        interstage_dp = self._to_float(config.get("interstageDp", config.get("interstage_dp")))
+        if interstage_dp is None:
+            interstage_dp = 5.0
+        return interstage_dp
+
+    def _speed_ratio(self, config: Dict[str, Any]) -> float:
+        speed_ratio = self._to_float(config.get("speedRatio", config.get("speed_ratio")))
+        if speed_ratio is None:
+            speed_ratio = 1.0
+        return speed_ratio
+
     def _calc_stage_suction_temp(self, live_data: Dict[str, Any], stage: int, cooler_approach_f: float) -> Optional[float]:
         up_discharge = self._get_value_with_aliases(f"stg{stage - 1}_discharge_temp", live_data)
         if up_discharge is None:
@@ -242,6 +293,25 @@ class DataResolver:
             return None
         return up_discharge - interstage_dp
 
+    def _calc_compressor_rpm(self, live_data: Dict[str, Any], speed_ratio: float) -> Optional[float]:
+        rpm = self._get_value_with_aliases("engine_rpm", live_data)
+        if rpm is None:
+            return None
+        return rpm * speed_ratio
+
+    def _calc_baro_pressure(self, live_data: Dict[str, Any], config: Dict[str, Any]) -> Optional[float]:
+        elevation_ft = self._to_float(config.get("elevation_ft", live_data.get("elevation_ft")))
+        if elevation_ft is None:
+            elevation_ft = 0.0
+        return 14.696 * (1 - 6.8753e-6 * elevation_ft) ** 5.2559
+
+    def _calc_gas_k_avg(self, live_data: Dict[str, Any], config: Dict[str, Any]) -> Optional[float]:
+        k_suction = self._to_float(config.get("k_suction", live_data.get("k_suction")))
+        k_discharge = self._to_float(config.get("k_discharge", live_data.get("k_discharge")))
+        if k_suction is None or k_discharge is None:
+            return None
+        return (k_suction + k_discharge) / 2.0
+
     def _calculate_value(
         self,
         unit_id: str,
@@ -256,46 +326,10 @@ class DataResolver:
         if not calc_key:
             return None
 
-        cooler_approach_f = self._to_float(config.get("coolerApproachF", config.get("cooler_approach_f")))
-        if cooler_approach_f is None:
-            cooler_approach_f = self._to_float(live_data.get("cooler_approach_f"))
-        if cooler_approach_f is None:
-            cooler_approach_f = 15.0
-
-        interstage_dp = self._to_float(config.get("interstageDp", config.get("interstage_dp")))
-        if interstage_dp is None:
-            interstage_dp = 5.0
-
-        speed_ratio = self._to_float(config.get("speedRatio", config.get("speed_ratio")))
-        if speed_ratio is None:
-            speed_ratio = 1.0
-
         # Built-in calculator keys from the architecture plan.
-        normalized_key = calc_key.lower()
-        if normalized_key in {"stage2_suction_temp", "stg2_suction_temp"}:
-            return self._calc_stage_suction_temp(live_data, stage=2, cooler_approach_f=cooler_approach_f)
-        if normalized_key in {"stage3_suction_temp", "stg3_suction_temp"}:
-            return self._calc_stage_suction_temp(live_data, stage=3, cooler_approach_f=cooler_approach_f)
-        if normalized_key in {"stage2_suction_press", "stage2_suction_pressure", "stg2_suction_press"}:
-            return self._calc_stage_suction_press(live_data, stage=2, interstage_dp=interstage_dp)
-        if normalized_key in {"stage3_suction_press", "stage3_suction_pressure", "stg3_suction_press"}:
-            return self._calc_stage_suction_press(live_data, stage=3, interstage_dp=interstage_dp)
-        if normalized_key in {"compressor_rpm", "comp_rpm"}:
-            rpm = self._get_value_with_aliases("engine_rpm", live_data)
-            if rpm is None:
-                return None
-            return rpm * speed_ratio
-        if normalized_key in {"baro_pressure", "barometric_pressure"}:
-            elevation_ft = self._to_float(config.get("elevation_ft", live_data.get("elevation_ft")))
-            if elevation_ft is None:
-                elevation_ft = 0.0
-            return 14.696 * (1 - 6.8753e-6 * elevation_ft) ** 5.2559
-        if normalized_key in {"gas_k_avg", "k_avg"}:
-            k_suction = self._to_float(config.get("k_suction", live_data.get("k_suction")))
-            k_discharge = self._to_float(config.get("k_discharge", live_data.get("k_discharge")))
-            if k_suction is None or k_discharge is None:
-                return None
-            return (k_suction + k_discharge) / 2.0
+        handler = _CALC_DISPATCH.get(calc_key.lower())
+        if handler is not None:
+            return handler(self, live_data, config)
 
         # Simple expression support (safe eval with numeric namespace only).
         # Example: "stg1_discharge_temp - 15"
@@ -305,9 +339,9 @@ class DataResolver:
                 num = self._to_float(value)
                 if num is not None and re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", str(key)):
                     namespace[str(key)] = num
-            namespace["cooler_approach_f"] = cooler_approach_f
-            namespace["interstage_dp"] = interstage_dp
-            namespace["speed_ratio"] = speed_ratio
+            namespace["cooler_approach_f"] = self._cooler_approach_f(live_data, config)
+            namespace["interstage_dp"] = self._interstage_dp(config)
+            namespace["speed_ratio"] = self._speed_ratio(config)
             try:
                 val = eval(calc_key, {"__builtins__": {}}, namespace)
                 return self._to_float(val)
@@ -323,8 +357,17 @@ class DataResolver:
         live_value: Optional[float],
         live_data: Optional[Dict[str, Any]] = None,
         config: Optional[Dict[str, Any]] = None,
+        lookup_aliases: bool = True,
+        timestamp: Optional[str] = None,
     ) -> ResolveResult:
-        now_iso = datetime.utcnow().isoformat()
+        """
+        Resolve a single parameter through its source chain.
+
+        ``live_value`` is authoritative when ``lookup_aliases`` is False; callers
+        that already ran the alias lookup pass False to avoid repeating it.
+        Batch callers pass ``timestamp`` so every result shares one value.
+        """
+        now_iso = timestamp or _utc_now_iso()
         cfg = config or {}
         data = live_data or {}
 
@@ -332,7 +375,9 @@ class DataResolver:
 
         for source in chain:
             if source == "MODBUS":
-                value = live_value if live_value is not None else self._get_value_with_aliases(parameter, data)
+                value = live_value
+                if value is None and lookup_aliases:
+                    value = self._get_value_with_aliases(parameter, data)
                 if value is None:
                     continue
                 if not self._is_live_value_valid(value, cfg):
@@ -407,8 +452,10 @@ class DataResolver:
         parameters: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         configs = parameter_configs or {}
+        data = live_data or {}
+        now_iso = _utc_now_iso()
         if parameters is None:
-            parameters = list(configs.keys()) if configs else list((live_data or {}).keys())
+            parameters = list(configs.keys()) if configs else list(data.keys())
 
             # Include runtime manual keys so operator-set values appear in resolved output.
             manual_params = list(self.manual_values.get(unit_id, {}).keys())
@@ -423,13 +470,15 @@ class DataResolver:
 
         for param in parameters:
             cfg = configs.get(param, {})
-            live_val = self._get_value_with_aliases(param, live_data or {})
+            live_val = self._get_value_with_aliases(param, data)
             result = self.resolve(
                 unit_id=unit_id,
                 parameter=param,
                 live_value=live_val,
-                live_data=live_data or {},
+                live_data=data,
                 config=cfg,
+                lookup_aliases=False,
+                timestamp=now_iso,
             )
             values[param] = result.value
             sources[param] = result.source
@@ -437,7 +486,7 @@ class DataResolver:
             details[param] = result.detail
 
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now_iso,
             "values": values,
             "sources": sources,
             "quality": quality,
@@ -446,6 +495,44 @@ class DataResolver:
         }
 
 
+_CalcHandler = Callable[[DataResolver, Dict[str, Any], Dict[str, Any]], Optional[float]]
+
+
+def _build_calc_dispatch() -> Dict[str, _CalcHandler]:
+    """Map every accepted built-in calculator key (lower-case) to its handler."""
+    dispatch: Dict[str, _CalcHandler] = {}
+
+    def register(keys, handler: _CalcHandler) -> None:
+        for key in keys:
+            dispatch[key] = handler
+
+    register(
+        ("stage2_suction_temp", "stg2_suction_temp"),
+        lambda s, d, c: s._calc_stage_suction_temp(d, 2, s._cooler_approach_f(d, c)),
+    )
+    register(
+        ("stage3_suction_temp", "stg3_suction_temp"),
+        lambda s, d, c: s._calc_stage_suction_temp(d, 3, s._cooler_approach_f(d, c)),
+    )
+    register(
+        ("stage2_suction_press", "stage2_suction_pressure", "stg2_suction_press"),
+        lambda s, d, c: s._calc_stage_suction_press(d, 2, s._interstage_dp(c)),
+    )
+    register(
+        ("stage3_suction_press", "stage3_suction_pressure", "stg3_suction_press"),
+        lambda s, d, c: s._calc_stage_suction_press(d, 3, s._interstage_dp(c)),
+    )
+    register(
+        ("compressor_rpm", "comp_rpm"),
+        lambda s, d, c: s._calc_compressor_rpm(d, s._speed_ratio(c)),
+    )
+    register(("baro_pressure", "barometric_pressure"), lambda s, d, c: s._calc_baro_pressure(d, c))
+    register(("gas_k_avg", "k_avg"), lambda s, d, c: s._calc_gas_k_avg(d, c))
+    return dispatch
+
+
+_CALC_DISPATCH = _build_calc_dispatch()
+
 _resolver: Optional[DataResolver] = None
 
 
@@ -5,15 +5,32 @@ Includes latency tracking and adaptive throttling.
 """
 
 import asyncio
+import collections
+import functools
+import inspect
+import itertools
 import logging
+import json
+import math
+import os
+import socket
+import sys
+import tempfile
 import time
 import re
-from typing import Dict, Any, Optional, List, Callable, Awaitable
+from typing import Dict, Any, Optional, List, Callable, Awaitable, Deque
 from datetime import datetime
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.client import AsyncModbusSerialClient
+from pymodbus import __version__ as _pymodbus_version
 from pymodbus.exceptions import ModbusException
+import numpy as np
 import yaml
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used for the register-map sidecar instead
+    orjson = None
 from pathlib import Path
 from sqlalchemy import select
 
@@ -26,30 +43,183 @@ logger = logging.getLogger(__name__)
 # Latency threshold for throttling (milliseconds)
 LATENCY_THRESHOLD_MS = 800
 
+# Connection settings fetched from the DB are reused for this long unless a reload forces a refresh
+CONNECTION_SETTINGS_TTL_S = 5.0
+
+# Upper bound on in-flight block reads per poll cycle (TCP only; RTU is strictly serial).
+# Only used when _PIPELINED_REQUESTS is true; newer pymodbus serializes every request under a lock.
+MAX_CONCURRENT_BLOCK_READS = 4
+
+# pymodbus 3.6.0-3.6.7 match responses by transaction id, so several TCP reads can be in flight at once.
+# From 3.6.8 the client holds a lock for each whole request, and concurrent reads never overlap.
+_PIPELINED_REQUESTS = tuple(
+    int(part) for part in re.match(r"(\d+)\.(\d+)\.(\d+)", _pymodbus_version).groups()
+) < (3, 6, 8)
+
+# Name fragments that promote a register to Group A (critical) regardless of its configured group
+_CRITICAL_KEYWORDS = ("pressure", "temp", "rpm", "speed", "status", "alarm", "fault")
+_CRITICAL_RE = re.compile("|".join(map(re.escape, _CRITICAL_KEYWORDS)))
+
+# Below this many registers the flat-tuple loop beats the NumPy path in _scale_values (measured crossover ~1500)
+NUMPY_SCALE_MIN_REGISTERS = 1500
+
+# libyaml-backed loader when available; the pure-Python loader is several times slower.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Imported/human register labels -> canonical app metric keys
+_CANONICAL_DIRECT_MAP = {
+    "engine rpm": "engine_rpm",
+    "engine lube oil pressure": "engine_oil_pressure",
+    "compressor lube oil pressure": "comp_oil_pressure",
+    "compressor oil temp": "comp_oil_temp",
+    "engine oil temp": "engine_oil_temp",
+    "engine jacket water temp": "jacket_water_temp",
+    "suction stage 1 pressure": "stg1_suction_pressure",
+    "discharge stage 1 pressure": "stg1_discharge_pressure",
+    "discharge stage 2 pressure": "stg2_discharge_pressure",
+    "3rd stage suction pressure": "stg3_suction_pressure",
+    "suction control out": "suction_valve_position",
+    "engine speed control out": "speed_control_output",
+    "recycle valve control out": "recycle_valve_position",
+    "pre-turbo flywheel exhaust temp": "pre_turbo_left",
+    "pre-turbo aux end exhaust temp": "pre_turbo_right",
+    "post turbo flywheel exhaust temp": "post_turbo_left",
+    "post turbo aux end exhaust temp": "post_turbo_right",
+}
+_BEARING_RE = re.compile(r"engine bearing (\d+) temp")
+_EXHAUST_CYL_RE = re.compile(r"engine exhaust cyl (\d+) (left|right)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _canonical_metric_name(name: str) -> Optional[str]:
+    """Map imported/human register labels to canonical app metric keys."""
+    key = " ".join(name.strip().lower().split())
+    canonical = _CANONICAL_DIRECT_MAP.get(key)
+    if canonical:
+        return canonical
+
+    match = _BEARING_RE.match(key)
+    if match:
+        return f"main_bearing_{match.group(1)}"
+
+    match = _EXHAUST_CYL_RE.match(key)
+    if match:
+        cyl = match.group(1)
+        side = match.group(2)
+        return f"exh_cyl{cyl}_{side}"
+
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _iso(dt: datetime) -> str:
+    """ISO string for a timestamp; status scrapes between polls reuse the last one."""
+    return dt.isoformat()
+
+
+def _sidecar_path(path: str) -> str:
+    """JSON sidecar next to a register map, e.g. registers.yaml -> .registers.json."""
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, f".{os.path.splitext(filename)[0]}.json")
+
+
+def _read_registers_sidecar(path: str, mtime_ns: int) -> Optional[List[Dict[str, Any]]]:
+    """Return the normalized register list from the sidecar if it was built from this mtime."""
+    try:
+        with open(_sidecar_path(path), 'rb') as f:
+            raw = f.read()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("source_mtime_ns") != mtime_ns:
+        return None
+    registers = payload.get("registers")
+    return registers if isinstance(registers, list) else None
+
+
+def _write_registers_sidecar(path: str, mtime_ns: int, registers: List[Dict[str, Any]]) -> None:
+    """Atomically write the sidecar; best effort (e.g. read-only mounts are skipped)."""
+    payload = {"source_mtime_ns": mtime_ns, "registers": registers}
+    sidecar = _sidecar_path(path)
+    try:
+        data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(sidecar) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp creates 0600 files; keep the file readable on host-mounted dirs
+                os.fchmod(f.fileno(), 0o644)
+                f.write(data)
+            os.replace(tmp_path, sidecar)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Register map sidecar not written: {e}")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_registers_cached(path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Parse and normalize a register map. Keyed on (path, mtime_ns) so an
+    unchanged file is parsed once; the returned list is shared and must
+    be treated as read-only. A JSON sidecar stamped with the YAML mtime
+    lets cold starts skip YAML parsing entirely.
+    """
+    registers = _read_registers_sidecar(path, mtime_ns)
+    if registers is not None:
+        return registers
+
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+    registers = data.get('registers', [])
+
+    # Some imported maps use PLC-style 4xxxx addresses. Convert them to 0-based Modbus offsets.
+    numeric_addrs = [
+        int(r.get("address"))
+        for r in registers
+        if isinstance(r, dict) and isinstance(r.get("address"), (int, float))
+    ]
+    if numeric_addrs:
+        high_addr_ratio = sum(1 for a in numeric_addrs if a >= 40000) / len(numeric_addrs)
+        if high_addr_ratio > 0.5:
+            base = 40001 if any(a >= 40001 for a in numeric_addrs) else 40000
+            for reg in registers:
+                if not isinstance(reg, dict):
+                    continue
+                addr = reg.get("address")
+                if isinstance(addr, (int, float)) and addr >= base:
+                    reg["address"] = int(addr) - base
+            logger.info("Converted PLC-style addresses to 0-based Modbus offsets using base %s", base)
+
+    _write_registers_sidecar(path, mtime_ns, registers)
+    return registers
+
 
 class LatencyMonitor:
     """Tracks poll cycle latency and manages throttling."""
     
     def __init__(self, threshold_ms: float = LATENCY_THRESHOLD_MS):
         self.threshold_ms = threshold_ms
-        self.recent_durations: List[float] = []  # Last N poll durations
         self.max_history = 10
+        self.recent_durations: Deque[float] = collections.deque(maxlen=self.max_history)  # Last N poll durations
+        self._running_sum = 0.0
         self.throttle_group_b = False
         self.slow_poll_count = 0
         self.total_poll_count = 0
-        self.alerts: List[Dict] = []
+        self.alerts: Deque[Dict] = collections.deque(maxlen=50)  # Keep only last 50 alerts
     
-    def record_poll(self, duration_ms: float):
+    def record_poll(self, duration_ms: float, now: Optional[datetime] = None):
         """Record a poll cycle duration and check for throttling."""
         self.total_poll_count += 1
+        if len(self.recent_durations) == self.recent_durations.maxlen:
+            self._running_sum -= self.recent_durations[0]
         self.recent_durations.append(duration_ms)
-        if len(self.recent_durations) > self.max_history:
-            self.recent_durations.pop(0)
+        self._running_sum += duration_ms
         
         if duration_ms > self.threshold_ms:
             self.slow_poll_count += 1
             self.throttle_group_b = True
-            self._emit_alert("MODBUS_LATENCY", duration_ms)
+            self._emit_alert("MODBUS_LATENCY", duration_ms, now)
             logger.warning(f"Poll cycle exceeded threshold: {duration_ms:.0f}ms > {self.threshold_ms}ms")
         else:
             # Allow recovery after 3 consecutive fast polls
@@ -57,22 +227,19 @@ class LatencyMonitor:
             if avg < self.threshold_ms * 0.7:
                 self.throttle_group_b = False
     
-    def _emit_alert(self, alert_type: str, value: float):
+    def _emit_alert(self, alert_type: str, value: float, now: Optional[datetime] = None):
         """Store alert for API access."""
         self.alerts.append({
             "type": alert_type,
             "value": value,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _iso(now or datetime.now()),
             "message": f"Poll cycle took {value:.0f}ms (threshold: {self.threshold_ms}ms)"
         })
-        # Keep only last 50 alerts
-        if len(self.alerts) > 50:
-            self.alerts = self.alerts[-50:]
     
     def get_average_latency(self) -> float:
         if not self.recent_durations:
             return 0.0
-        return sum(self.recent_durations) / len(self.recent_durations)
+        return self._running_sum / len(self.recent_durations)
     
     @property
     def throttle_active(self) -> bool:
@@ -87,7 +254,7 @@ class LatencyMonitor:
             "slow_poll_count": self.slow_poll_count,
             "total_poll_count": self.total_poll_count,
             "threshold_ms": self.threshold_ms,
-            "recent_alerts": self.alerts[-5:]
+            "recent_alerts": list(itertools.islice(self.alerts, max(len(self.alerts) - 5, 0), None))
         }
 
 
@@ -115,8 +282,16 @@ class ModbusPoller:
         self.last_values: Dict[int, int] = {}
         self.poll_count = 0
         self.error_count = 0
+        self.skipped_cycles = 0
+        # Scaled view of last_values, rebuilt lazily by get_data when the version moves
+        self._snapshot_version = 0
+        self._scaled_snapshot: Optional[Dict[str, float]] = None
+        self._scaled_snapshot_version = -1
         self._polling_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
+        self._connect_lock = asyncio.Lock()
+        self._conn_settings_cache_ts = 0.0
+        self._unit_kwarg = "device_id"  # "slave" on pymodbus releases before the rename
         
         # Latency monitoring
         self.latency_monitor = LatencyMonitor()
@@ -124,10 +299,27 @@ class ModbusPoller:
         # Register groups: A = critical (always poll), B = secondary (skipped when throttling)
         self.group_a_registers: List[Dict] = []
         self.group_b_registers: List[Dict] = []
+
+        # Read plans (contiguous (start, count) blocks) rebuilt only when the map changes
+        self._plan_all: List[tuple] = []
+        self._plan_a: List[tuple] = []
+
+        # Per-register scaling arrays (register order) consumed by _scale_values
+        self._reg_addrs: List[int] = []
+        self._reg_names: List[Any] = []
+        self._reg_canonical: List[Optional[str]] = []
+        self._reg_use_int: List[bool] = []
+        self._reg_round: List[bool] = []
+        self._scale_arr = np.zeros(0, dtype=np.float64)
+        self._int_scale_arr = np.zeros(0, dtype=np.int64)
+        self._bit_arr = np.zeros(0, dtype=np.int64)
+        # (address, name, scale, bit, canonical_name) per register for the pure-Python path
+        self._flat_regs: List[tuple] = []
         
-        # Load register map
+        # Load register map; a content hash lets reloads of an edited-but-equivalent map short-circuit
         self.register_config = self._load_register_config()
         self.name_to_register = {r['name']: r for r in self.register_config}
+        self._register_config_hash = self._hash_register_config(self.register_config)
         self._categorize_registers()
         
         logger.info(f"ModbusPoller initialized: {self.host}:{self.port} (slave {self.slave_id})")
@@ -149,21 +341,66 @@ class ModbusPoller:
 
     def _categorize_registers(self):
         """Separate registers into Group A (critical) and Group B (secondary)."""
-        critical_keywords = ["pressure", "temp", "rpm", "speed", "status", "alarm", "fault"]
-        
         self.group_a_registers = []
         self.group_b_registers = []
 
         for reg in self.register_config:
-            name_lower = reg.get('name', '').lower()
             group = reg.get('group', 'A').upper()
             
             # Use explicit group from config, or infer from name
-            if group == 'A' or any(kw in name_lower for kw in critical_keywords):
+            if group == 'A' or _CRITICAL_RE.search(reg.get('name', '').lower()):
                 self.group_a_registers.append(reg)
             else:
                 self.group_b_registers.append(reg)
 
+        self._build_read_plans()
+        self._snapshot_version += 1
+
+    def _build_read_plans(self):
+        """Precompute block plans and scaling arrays used while polling."""
+        self._plan_all = self._build_blocks(sorted({r['address'] for r in self.register_config}))
+        self._plan_a = self._build_blocks(sorted({r['address'] for r in self.group_a_registers}))
+
+        self._build_scaling_arrays()
+
+    def _build_scaling_arrays(self):
+        """Flatten the register map into arrays so scaling runs as one vectorized pass."""
+        addrs, names, scales, int_scales, bits, use_int = [], [], [], [], [], []
+        for reg in self.register_config:
+            scale = reg.get('scale', 1.0)
+            try:
+                bit_i = int(reg.get('bit'))
+            except (TypeError, ValueError):
+                bit_i = -1
+            # Invalid/negative bit indexes fall back to plain scaling, as before.
+            int_scale = isinstance(scale, int) and not isinstance(scale, bool)
+            name = reg.get('name')
+            addrs.append(int(reg['address']))
+            names.append(sys.intern(name) if isinstance(name, str) else name)
+            scales.append(float(scale))
+            int_scales.append(scale if int_scale else 0)
+            bits.append(bit_i)
+            # Bit points and integer scales produce ints, matching plain Python arithmetic.
+            use_int.append(bit_i >= 0 or int_scale)
+
+        self._reg_addrs = addrs
+        self._reg_names = names
+        # Canonical aliases resolved once per map load, never on the poll path.
+        self._reg_canonical = []
+        for name in names:
+            canonical_name = self._canonical_metric_name(name)
+            self._reg_canonical.append(canonical_name if canonical_name != name else None)
+        self._reg_use_int = use_int
+        self._reg_round = [s < 1 for s in scales]
+        self._scale_arr = np.asarray(scales, dtype=np.float64)
+        self._int_scale_arr = np.asarray(int_scales, dtype=np.int64)
+        self._bit_arr = np.asarray(bits, dtype=np.int64)
+        self._flat_regs = [
+            (addr, name, reg.get('scale', 1.0), bit_i, canonical_name)
+            for addr, name, reg, bit_i, canonical_name
+            in zip(addrs, names, self.register_config, bits, self._reg_canonical)
+        ]
+
     def _load_register_config(self) -> List[Dict[str, Any]]:
         """Load register configuration from YAML file."""
         try:
@@ -175,44 +412,39 @@ class ModbusPoller:
                 return []
                 
             logger.info(f"Loading register config from {config_path}")
-            with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
-                registers = data.get('registers', [])
-
-                # Some imported maps use PLC-style 4xxxx addresses. Convert them to 0-based Modbus offsets.
-                numeric_addrs = [
-                    int(r.get("address"))
-                    for r in registers
-                    if isinstance(r, dict) and isinstance(r.get("address"), (int, float))
-                ]
-                if numeric_addrs:
-                    high_addr_ratio = sum(1 for a in numeric_addrs if a >= 40000) / len(numeric_addrs)
-                    if high_addr_ratio > 0.5:
-                        base = 40001 if any(a >= 40001 for a in numeric_addrs) else 40000
-                        for reg in registers:
-                            if not isinstance(reg, dict):
-                                continue
-                            addr = reg.get("address")
-                            if isinstance(addr, (int, float)) and addr >= base:
-                                reg["address"] = int(addr) - base
-                        logger.info("Converted PLC-style addresses to 0-based Modbus offsets using base %s", base)
-
-                return registers
+            return _load_registers_cached(str(config_path), os.stat(config_path).st_mtime_ns)
         except Exception as e:
             logger.error(f"Error loading register config: {e}")
             return []
 
-    async def _update_connection_settings(self):
+    @staticmethod
+    def _hash_register_config(registers: List[Dict[str, Any]]) -> int:
+        """Hash the register fields that feed read plans, scaling and grouping."""
+        return hash(tuple(
+            (r.get('name'), r.get('address'), r.get('scale'), r.get('bit'), r.get('group'))
+            for r in registers
+        ))
+
+    async def _update_connection_settings(self, force: bool = False):
         """Fetch active connection settings from DB (supports mode switching)."""
+        if not force and time.monotonic() - self._conn_settings_cache_ts < CONNECTION_SETTINGS_TTL_S:
+            return
+
         try:
             async with async_session_factory() as db:
-                result = await db.execute(select(ModbusServerConfig))
-                configs = result.scalars().all()
-                if not configs:
-                    return
-
                 # Prefer the primary package row; otherwise use the first available config.
-                conf = next((c for c in configs if c.unit_id == "GCS-001"), configs[0])
+                result = await db.execute(
+                    select(ModbusServerConfig).where(ModbusServerConfig.unit_id == "GCS-001")
+                )
+                conf = result.scalar_one_or_none()
+                if conf is None:
+                    result = await db.execute(
+                        select(ModbusServerConfig).order_by(ModbusServerConfig.id).limit(1)
+                    )
+                    conf = result.scalar_one_or_none()
+                self._conn_settings_cache_ts = time.monotonic()
+                if conf is None:
+                    return
                 server_override = self._load_server_override(conf.unit_id)
                 configured_mode = str(server_override.get("communication_mode", "TCP_IP")).upper()
                 serial_port = str(server_override.get("serial_port") or self.serial_port).strip()
@@ -254,11 +486,10 @@ class ModbusPoller:
                 new_host = str(new_host).strip() if new_host else self.host
                 new_port = int(new_port) if new_port is not None else self.port
 
-                # Log if changing
+                # Only endpoint/transport changes need a new socket; the slave id is per request.
                 connection_changed = (
                     new_host != self.host
                     or new_port != self.port
-                    or new_slave != self.slave_id
                     or new_mode != self.communication_mode
                     or serial_port != self.serial_port
                     or baud_rate != self.baud_rate
@@ -291,18 +522,38 @@ class ModbusPoller:
                     # Trigger reconnect
                     await self.disconnect()
                     await self.connect()
+                elif new_slave != self.slave_id:
+                    logger.info(
+                        "Slave id changed for %s: %s -> %s (connection kept)",
+                        conf.unit_id,
+                        self.slave_id,
+                        new_slave,
+                    )
+                    self.slave_id = new_slave
         except Exception as e:
             logger.error(f"Failed to update connection settings from DB: {e}")
 
     async def reload_config(self):
         """Reload configuration from file and DB."""
         logger.info("Reloading Modbus configuration...")
-        self.register_config = self._load_register_config()
-        self.name_to_register = {r['name']: r for r in self.register_config}
-        self._categorize_registers()
+        registers = self._load_register_config()
+        # The cached loader hands back the same list for an unchanged (path, mtime_ns)
+        config_hash = (
+            self._register_config_hash
+            if registers is self.register_config
+            else self._hash_register_config(registers)
+        )
+        if config_hash == self._register_config_hash:
+            # Same file and content: keep read plans, scaling arrays and canonical names.
+            logger.info("Register map unchanged; keeping precomputed read plans")
+        else:
+            self.register_config = registers
+            self.name_to_register = {r['name']: r for r in self.register_config}
+            self._register_config_hash = config_hash
+            self._categorize_registers()
         
         # Update connection settings (Simulation vs Real World)
-        await self._update_connection_settings()
+        await self._update_connection_settings(force=True)
         
         logger.info(f"Reloaded {len(self.register_config)} registers")
     
@@ -324,9 +575,12 @@ class ModbusPoller:
                 )
             else:
                 self.client = AsyncModbusTcpClient(host=self.host, port=self.port, timeout=self.timeout)
+            self._unit_kwarg = self._detect_unit_kwarg()
             await self.client.connect()
             self.connected = self.client.connected
             if self.connected:
+                if self.communication_mode != "RS485_RTU":
+                    self._tune_tcp_socket()
                 if self.communication_mode == "RS485_RTU":
                     logger.info(
                         "Connected to Modbus RS485 device at %s (%s bps, %s%s%s)",
@@ -344,6 +598,29 @@ class ModbusPoller:
             self.connected = False
             return False
     
+    def _detect_unit_kwarg(self) -> str:
+        """Pick the unit-id keyword the installed pymodbus accepts, once per client."""
+        try:
+            params = inspect.signature(self.client.read_holding_registers).parameters
+        except (TypeError, ValueError):
+            return "device_id"
+        return "device_id" if "device_id" in params else "slave"
+
+    def _tune_tcp_socket(self):
+        """Disable Nagle and enable keepalive on the client's TCP socket."""
+        # The transport lives on the transaction manager (ctx) in newer pymodbus releases.
+        transport = getattr(getattr(self.client, "ctx", None), "transport", None) or getattr(self.client, "transport", None)
+        sock = transport.get_extra_info("socket") if transport is not None else None
+        if sock is None:
+            logger.debug("Modbus TCP socket not exposed by client; leaving socket options unchanged")
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            logger.debug("Set TCP_NODELAY and SO_KEEPALIVE on Modbus socket")
+        except OSError as e:
+            logger.warning(f"Could not set Modbus socket options: {e}")
+
     async def disconnect(self):
         """Close Modbus connection."""
         if self.client:
@@ -352,14 +629,15 @@ class ModbusPoller:
     
     async def read_registers(self, start_address: int, count: int) -> Optional[List[int]]:
         """Read holding registers from device."""
-        if not self.connected and not await self.connect():
-            return None
+        if not self.connected:
+            # Concurrent block reads must not race each other into reconnecting.
+            async with self._connect_lock:
+                if not self.connected and not await self.connect():
+                    return None
         
         try:
-            try:
-                result = await self.client.read_holding_registers(address=start_address, count=count, device_id=self.slave_id)
-            except TypeError:
-                result = await self.client.read_holding_registers(address=start_address, count=count, slave=self.slave_id)
+            unit_kwargs = {self._unit_kwarg: self.slave_id}
+            result = await self.client.read_holding_registers(address=start_address, count=count, **unit_kwargs)
             
             if result.isError():
                 self.error_count += 1
@@ -371,6 +649,25 @@ class ModbusPoller:
             self.connected = False
             return None
     
+    async def _read_block(
+        self, start: int, count: int, out: Dict[int, int], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Dict[int, int]:
+        """Read one contiguous block in protocol-sized chunks into ``out``."""
+        current_start, remaining = start, count
+        while remaining > 0:
+            chunk = min(remaining, 100)
+            if semaphore is None:
+                values = await self.read_registers(current_start, chunk)
+            else:
+                async with semaphore:
+                    values = await self.read_registers(current_start, chunk)
+            if values:
+                for i, val in enumerate(values):
+                    out[current_start + i] = val
+            current_start += chunk
+            remaining -= chunk
+        return out
+
     async def poll_all_registers(self) -> Dict[str, float]:
         """Poll registers with latency tracking and throttling."""
         start_time = time.monotonic()
@@ -378,36 +675,39 @@ class ModbusPoller:
         
         # Determine which registers to poll
         if self.latency_monitor.throttle_active:
-            registers_to_poll = self.group_a_registers
-            logger.debug(f"Throttle active - polling Group A only ({len(registers_to_poll)} registers)")
+            blocks = self._plan_a
+            logger.debug(f"Throttle active - polling Group A only ({len(self.group_a_registers)} registers)")
         else:
-            registers_to_poll = self.register_config
+            blocks = self._plan_all
         
-        if not registers_to_poll:
+        if not blocks:
             return {}
         
-        # Build contiguous blocks
-        addresses = sorted([r['address'] for r in registers_to_poll])
-        blocks = self._build_blocks(addresses)
-        
-        # Read blocks
-        for start, count in blocks:
-            current_start, remaining = start, count
-            while remaining > 0:
-                chunk = min(remaining, 100)
-                values = await self.read_registers(current_start, chunk)
-                if values:
-                    for i, val in enumerate(values):
-                        all_raw_values[current_start + i] = val
-                current_start += chunk
-                remaining -= chunk
+        if _PIPELINED_REQUESTS and self.communication_mode != "RS485_RTU":
+            # Read blocks concurrently; results come back in block order. Every read is awaited
+            # before a failure is re-raised, so none is left running against the client.
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_BLOCK_READS)
+            results = await asyncio.gather(
+                *(self._read_block(start, count, {}, semaphore) for start, count in blocks),
+                return_exceptions=True,
+            )
+            for block_values in results:
+                if isinstance(block_values, BaseException):
+                    raise block_values
+                all_raw_values.update(block_values)
+        else:
+            # The client serializes requests anyway; a plain loop skips the gather/semaphore overhead
+            for start, count in blocks:
+                await self._read_block(start, count, all_raw_values)
         
-        # Record latency
+        # Record latency; one wall-clock reading serves both the alert and last_poll_time
         duration_ms = (time.monotonic() - start_time) * 1000
-        self.latency_monitor.record_poll(duration_ms)
+        now = datetime.now()
+        self.latency_monitor.record_poll(duration_ms, now)
         
         self.last_values.update(all_raw_values)
-        self.last_poll_time = datetime.now()
+        self._snapshot_version += 1
+        self.last_poll_time = now
         self.poll_count += 1
         
         return self._scale_values(all_raw_values)
@@ -416,107 +716,118 @@ class ModbusPoller:
         """Build contiguous address blocks for efficient reading."""
         if not addresses:
             return []
-        blocks = []
-        start = prev = addresses[0]
-        count = 1
-        for addr in addresses[1:]:
-            if addr == prev + 1:
-                count += 1
-                prev = addr
-            else:
-                blocks.append((start, count))
-                start = prev = addr
-                count = 1
-        blocks.append((start, count))
-        return blocks
+        # A block ends wherever the next address is not exactly one higher.
+        arr = np.asarray(addresses, dtype=np.int64)
+        breaks = np.flatnonzero(np.diff(arr) != 1) + 1
+        starts = np.concatenate(([0], breaks))
+        ends = np.concatenate((breaks, [len(arr)]))
+        return [(int(arr[s]), int(e - s)) for s, e in zip(starts, ends)]
     
     def _scale_values(self, raw_data: Dict[int, int]) -> Dict[str, float]:
         """Convert raw register values to scaled engineering units."""
+        count = len(self._reg_addrs)
+        if not raw_data or not count:
+            return {}
+        if count < NUMPY_SCALE_MIN_REGISTERS:
+            return self._scale_values_flat(raw_data)
+
+        # Missing addresses are marked -1; register words are unsigned 16-bit.
+        get = raw_data.get
+        raws = np.fromiter((get(a, -1) for a in self._reg_addrs), dtype=np.int64, count=count)
+        present = np.flatnonzero(raws >= 0).tolist()
+
+        float_vals = (raws * self._scale_arr).tolist()
+
+        # Discrete points can be packed into a word; decode bit when provided by map.
+        bit_arr = self._bit_arr
+        bits = (raws >> np.clip(bit_arr, 0, 62)) & 1
+        int_vals = np.where(bit_arr >= 0, bits, raws * self._int_scale_arr).tolist()
+
         scaled = {}
-        for reg in self.register_config:
-            addr, name, scale = reg.get('address'), reg.get('name'), reg.get('scale', 1.0)
-            if addr in raw_data:
-                raw_val = raw_data[addr]
-                bit_index = reg.get("bit")
-
-                # Discrete points can be packed into a word; decode bit when provided by map.
-                if bit_index is not None:
-                    try:
-                        bit_i = int(bit_index)
-                        normalized = 1 if ((int(raw_val) >> bit_i) & 0x1) else 0
-                    except Exception:
-                        val = raw_val * scale
-                        normalized = round(val, 2) if scale < 1 else val
-                else:
-                    val = raw_val * scale
-                    normalized = round(val, 2) if scale < 1 else val
+        names = self._reg_names
+        canonical_names = self._reg_canonical
+        use_int = self._reg_use_int
+        round_flags = self._reg_round
+        for i in present:
+            name = names[i]
+            if use_int[i]:
+                normalized = int_vals[i]
+            elif round_flags[i]:
+                # Python's round() keeps the existing decimal behaviour (np.round differs on ties).
+                normalized = round(float_vals[i], 2)
+            else:
+                normalized = float_vals[i]
+            scaled[name] = normalized
 
-                scaled[name] = normalized
+            canonical_name = canonical_names[i]
+            if canonical_name:
+                scaled[canonical_name] = normalized
+        return scaled
 
-                canonical_name = self._canonical_metric_name(name)
-                if canonical_name and canonical_name != name:
-                    scaled[canonical_name] = normalized
+    def _scale_values_flat(self, raw_data: Dict[int, int]) -> Dict[str, float]:
+        """Scalar scaling over pre-flattened register tuples, for small maps."""
+        scaled = {}
+        get = raw_data.get
+        for addr, name, scale, bit_i, canonical_name in self._flat_regs:
+            raw_val = get(addr)
+            if raw_val is None:
+                continue
+
+            # Discrete points can be packed into a word; decode bit when provided by map.
+            if bit_i >= 0:
+                normalized = (int(raw_val) >> bit_i) & 0x1
+            else:
+                val = raw_val * scale
+                normalized = round(val, 2) if scale < 1 else val
+
+            scaled[name] = normalized
+            if canonical_name:
+                scaled[canonical_name] = normalized
         return scaled
 
     def _canonical_metric_name(self, name: Any) -> Optional[str]:
         """Map imported/human register labels to canonical app metric keys."""
         if not isinstance(name, str):
             return None
-
-        key = " ".join(name.strip().lower().split())
-        direct_map = {
-            "engine rpm": "engine_rpm",
-            "engine lube oil pressure": "engine_oil_pressure",
-            "compressor lube oil pressure": "comp_oil_pressure",
-            "compressor oil temp": "comp_oil_temp",
-            "engine oil temp": "engine_oil_temp",
-            "engine jacket water temp": "jacket_water_temp",
-            "suction stage 1 pressure": "stg1_suction_pressure",
-            "discharge stage 1 pressure": "stg1_discharge_pressure",
-            "discharge stage 2 pressure": "stg2_discharge_pressure",
-            "3rd stage suction pressure": "stg3_suction_pressure",
-            "suction control out": "suction_valve_position",
-            "engine speed control out": "speed_control_output",
-            "recycle valve control out": "recycle_valve_position",
-            "pre-turbo flywheel exhaust temp": "pre_turbo_left",
-            "pre-turbo aux end exhaust temp": "pre_turbo_right",
-            "post turbo flywheel exhaust temp": "post_turbo_left",
-            "post turbo aux end exhaust temp": "post_turbo_right",
-        }
-        if key in direct_map:
-            return direct_map[key]
-
-        match = re.match(r"engine bearing (\d+) temp", key)
-        if match:
-            return f"main_bearing_{match.group(1)}"
-
-        match = re.match(r"engine exhaust cyl (\d+) (left|right)", key)
-        if match:
-            cyl = match.group(1)
-            side = match.group(2)
-            return f"exh_cyl{cyl}_{side}"
-
-        return None
+        return _canonical_metric_name(name)
     
     def get_data(self) -> Dict[str, float]:
-        return self._scale_values(self.last_values)
+        """Scaled view of the latest raw values. Shared between callers; do not mutate."""
+        if self._scaled_snapshot is None or self._scaled_snapshot_version != self._snapshot_version:
+            self._scaled_snapshot = self._scale_values(self.last_values)
+            self._scaled_snapshot_version = self._snapshot_version
+        return self._scaled_snapshot
     
     async def start_polling(self, callback=None):
         """Start continuous polling loop with latency monitoring."""
         logger.info(f"Starting polling loop (interval: {self.poll_interval}s, threshold: {LATENCY_THRESHOLD_MS}ms)")
         self._stop_event.clear()
 
+        # Pace against a monotonic deadline so poll duration doesn't add drift to the cadence.
+        next_deadline = time.monotonic()
         while not self._stop_event.is_set():
             try:
                 values = await self.poll_all_registers()
                 if values and callback:
                     await callback(values)
-                await asyncio.sleep(self.poll_interval)
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Polling error: {e}")
-                await asyncio.sleep(self.poll_interval)
+
+            next_deadline += self.poll_interval
+            delay = next_deadline - time.monotonic()
+            if delay < 0:
+                # Overran the interval: drop the missed ticks instead of firing back-to-back cycles.
+                missed = math.ceil(-delay / self.poll_interval)
+                next_deadline += missed * self.poll_interval
+                delay = max(0.0, next_deadline - time.monotonic())
+                self.skipped_cycles += missed
+                logger.debug(f"Poll cycle overran interval; skipped {missed} cycle(s)")
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                break
 
     async def stop(self):
         """Stop background polling and close Modbus connection."""
@@ -538,7 +849,8 @@ class ModbusPoller:
         status = {
             "host": self.host, "port": self.port, "connected": self.connected,
             "poll_count": self.poll_count, "error_count": self.error_count,
-            "last_poll": self.last_poll_time.isoformat() if self.last_poll_time else None,
+            "skipped_cycles": self.skipped_cycles,
+            "last_poll": _iso(self.last_poll_time) if self.last_poll_time else None,
             "registers_cached": len(self.last_values),
             "group_a_count": len(self.group_a_registers),
             "group_b_count": len(self.group_b_registers),
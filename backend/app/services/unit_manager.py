@@ -6,7 +6,7 @@ from typing import Dict, Optional, List, Any
 from dataclasses import dataclass
 import logging
 import asyncio
-from datetime import datetime
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +40,8 @@ class MultiUnitManager:
         self._physics_engines: Dict[str, Any] = {}
         self._alarm_engines: Dict[str, Any] = {}
         self._live_data: Dict[str, Dict] = {}
-        self._live_updated_at: Dict[str, datetime] = {}
+        self._live_version: Dict[str, int] = {}  # Bumped on every snapshot replacement
+        self._live_updated_at: Dict[str, Optional[float]] = {}  # time.monotonic() of last update
     
     def register_unit(self, config: UnitConfig) -> bool:
         """Register a new unit."""
@@ -50,7 +51,7 @@ class MultiUnitManager:
         self.units[config.unit_id] = config
         if config.unit_id not in self._live_data:
             self._live_data[config.unit_id] = {}
-            self._live_updated_at[config.unit_id] = datetime.min
+            self._live_updated_at[config.unit_id] = None
         logger.info(f"Registered unit: {config.unit_id} ({config.name})")
         return True
     
@@ -69,6 +70,7 @@ class MultiUnitManager:
             del self._live_data[unit_id]
         if unit_id in self._live_updated_at:
             del self._live_updated_at[unit_id]
+        self._live_version.pop(unit_id, None)
         
         logger.info(f"Unregistered unit: {unit_id}")
         return True
@@ -91,22 +93,29 @@ class MultiUnitManager:
         ]
     
     def update_live_data(self, unit_id: str, data: Dict):
-        """Update live data for a unit."""
-        if unit_id not in self._live_data:
-            self._live_data[unit_id] = {}
+        """
+        Update live data for a unit.
+        The snapshot is stored by reference: callers hand over a freshly built
+        dict and must not mutate it afterwards (wrap in MappingProxyType if needed).
+        """
         # Replace snapshot to avoid carrying stale/previous-cycle values as "live".
-        self._live_data[unit_id] = dict(data or {})
-        self._live_updated_at[unit_id] = datetime.utcnow()
+        self._live_data[unit_id] = data or {}
+        self._live_version[unit_id] = self._live_version.get(unit_id, 0) + 1
+        self._live_updated_at[unit_id] = time.monotonic()
     
     def get_live_data(self, unit_id: str) -> Dict:
         """Get current live data for a unit."""
         return self._live_data.get(unit_id, {})
 
+    def get_live_data_version(self, unit_id: str) -> int:
+        """Snapshot counter; readers compare it to detect a newer snapshot."""
+        return self._live_version.get(unit_id, 0)
+
     def get_live_data_age_seconds(self, unit_id: str) -> Optional[float]:
         updated_at = self._live_updated_at.get(unit_id)
-        if not updated_at or updated_at == datetime.min:
+        if updated_at is None:
             return None
-        return max(0.0, (datetime.utcnow() - updated_at).total_seconds())
+        return max(0.0, time.monotonic() - updated_at)
     
     def get_stage_count(self, unit_id: str) -> int:
         """Get number of stages for a unit."""
@@ -6,19 +6,61 @@ Supports hot-reloading of configuration.
 """
 
 import argparse
+import array
 import asyncio
+import hashlib
+import json
 import logging
 import math
 import random
+import socket
+import tempfile
+import threading
 import time
 import os
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, NamedTuple, Optional
 
 import yaml
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# NumPy vectorizes the per-tick update; the scalar path is used without it
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional Numba JIT for the per-tick kernel (requires NumPy)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Fast JSON for the parsed-config cache file; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# OS-level file watching (inotify/FSEvents); polling is used without it
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
+# libuv-based event loop for the server (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Robust imports for pymodbus versions
-from pymodbus.server import StartAsyncTcpServer
+from pymodbus.server import ModbusTcpServer
 
 # Handle ModbusDeviceContext renaming (v3.6+)
 try:
@@ -38,123 +80,490 @@ except ImportError:
     from pymodbus.datastore.context import ModbusServerContext
     from pymodbus.datastore.store import ModbusSequentialDataBlock
 
+# Dynamic registers needed before update_loop moves the compute to a worker
+# thread; below this the executor round-trip costs more than the compute
+OFFLOAD_MIN_REGISTERS = 2000
+
+# Slots in the coil/discrete-input/input-register blocks, which the simulator
+# doesn't populate (address 0 plus the context's 1-based offset)
+UNUSED_BLOCK_SIZE = 2
+
+
+class TypedDataBlock(ModbusSequentialDataBlock):
+    """Sequential datablock backed by a compact typed buffer.
+
+    Registers are stored as ``array('H')`` (uint16) and bits as a
+    ``bytearray`` instead of a list of boxed ints.
+    """
+
+    def __init__(self, address: int, size: int, bits: bool = False):
+        super().__init__(address, [0])
+        self.values = bytearray(size) if bits else array.array('H', bytes(2 * size))
+        self.default_value = 0
+
+    def grow(self, size: int):
+        """Extend the buffer with zeros to at least ``size`` slots, in place."""
+        missing = size - len(self.values)
+        if missing > 0:
+            self.values.extend(bytes(missing) if isinstance(self.values, bytearray) else [0] * missing)
+
+    def _checked_start(self, address: int, count: int) -> int:
+        """Buffer index for address; raises so pymodbus answers with an exception response."""
+        start = address - self.address
+        if start < 0 or start + count > len(self.values):
+            raise IndexError(f"Address range {address}+{count} outside datablock")
+        return start
+
+    def getValues(self, address, count=1):
+        """Return the requested values as a list, like the list-backed block."""
+        start = self._checked_start(address, count)
+        chunk = self.values[start:start + count]
+        if isinstance(chunk, bytearray):
+            return [bool(b) for b in chunk]
+        return chunk.tolist()
+
+    def setValues(self, address, values):
+        """Set values, converting them to the buffer's element type."""
+        if not isinstance(values, list):
+            values = [values]
+        start = self._checked_start(address, len(values))
+        if isinstance(self.values, bytearray):
+            self.values[start:start + len(values)] = bytearray(values)
+        else:
+            self.values[start:start + len(values)] = array.array(self.values.typecode, values)
+
+
+class NoDelayTcpServer(ModbusTcpServer):
+    """Modbus TCP server that tunes each accepted client socket.
+
+    Modbus is small request/response frames, so Nagle's algorithm is disabled
+    explicitly rather than relying on the event loop's default.
+    """
+
+    def callback_new_connection(self):
+        handler = super().callback_new_connection()
+        connection_made = handler.connection_made
+
+        def _connection_made(transport):
+            _tune_client_socket(transport.get_extra_info('socket'))
+            connection_made(transport)
+
+        handler.connection_made = _connection_made
+        return handler
+
+
+def _tune_client_socket(sock):
+    """Set TCP_NODELAY (and TCP_QUICKACK on Linux) on an accepted socket."""
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if hasattr(socket, 'TCP_QUICKACK'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+    except OSError as e:
+        logger.warning(f"Could not set client socket options: {e}")
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger("ModbusSimulator")
+# watchfiles logs every change batch at INFO; the reload is logged below
+logging.getLogger("watchfiles").setLevel(logging.WARNING)
+
+# Register category flags by how they behave while the engine is STOPPED;
+# CAT_OTHER is 0 so "has a stopped override" is a plain truth/mask test
+CAT_OTHER = 0
+CAT_ZERO_WHEN_STOPPED = 1
+CAT_AMBIENT_WHEN_STOPPED = 2
+CAT_STOPPED_OVERRIDE = CAT_ZERO_WHEN_STOPPED | CAT_AMBIENT_WHEN_STOPPED
+
+CATEGORY_CODES = {
+    'engine': CAT_ZERO_WHEN_STOPPED,
+    'compressor': CAT_ZERO_WHEN_STOPPED,
+    'stage1': CAT_ZERO_WHEN_STOPPED,
+    'stage2': CAT_ZERO_WHEN_STOPPED,
+    'stage3': CAT_ZERO_WHEN_STOPPED,
+    'exhaust': CAT_AMBIENT_WHEN_STOPPED,
+    'bearings': CAT_AMBIENT_WHEN_STOPPED,
+}
+
+
+if njit is not None and np is not None:
+    @njit(cache=True, nogil=True)
+    def _compute_values_kernel(nominal, noise, scale, min_raw, max_raw, category,
+                               stopped, trend_factor, noise_enabled, out):
+        """Fused per-register loop matching CompressorSimulator.get_simulated_value."""
+        for i in range(out.shape[0]):
+            if stopped and category[i]:
+                out[i] = 0 if category[i] == CAT_ZERO_WHEN_STOPPED else int(80 / scale[i])
+                continue
+            value = nominal[i] * trend_factor
+            if noise_enabled and noise[i] > 0:
+                value += np.random.normal(0.0, noise[i])
+            value = math.trunc(value / scale[i])
+            value = max(min_raw[i], min(max_raw[i], value))
+            out[i] = max(0.0, value)
+        return out
+else:
+    _compute_values_kernel = None
+
+
+class RegisterPlan(NamedTuple):
+    """Per-register constants precomputed from the config at load time."""
+    address: int
+    static_value: Optional[int]  # set for registers with a default but no nominal
+    nominal: float
+    noise: float
+    scale: float
+    min_raw: int  # clamp bounds already divided by scale
+    max_raw: int
+    category: int
 
 
 class CompressorSimulator:
     """Simulates realistic compressor operating conditions."""
     
     def __init__(self, config: Dict[str, Any]):
+        self._rng = np.random.default_rng() if np is not None else None
+        # Guards compiled state against compute_values running in a worker thread
+        self._lock = threading.Lock()
+        self._generation = 0
         self.load_config(config)
         
         # Simulation state
         self.engine_state = 8  # RUNNING
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         
     def load_config(self, config: Dict[str, Any]):
         """Load or reload simulator configuration."""
         self.config = config
         self.simulation = config.get('simulation', {}) or {}
-        self.registers = self._normalize_registers(config.get('registers', []) or [])
+        self.registers = config.get('registers', []) or []
+        plans = self._compile_registers(self.registers, self._plc_address_base(self.registers))
+        with self._lock:
+            self.trend_enabled = bool(self.simulation.get('trend_enabled', True))
+            self.noise_enabled = bool(self.simulation.get('noise_enabled', True))
+            # Static registers never change, so they are written once per load
+            self.static_plans = [p for p in plans if p.static_value is not None]
+            self.plans = [p for p in plans if p.static_value is None]
+            self._static_runs = self._build_runs(self.static_plans)
+            self._static_values = array.array('H', [p.static_value for p in self.static_plans])
+            self._runs = self._build_runs(self.plans)
+            self._bound_context = None  # re-probe the datastore and rewrite statics
+            if np is not None:
+                self._build_arrays(self.plans)
+            self._generation += 1
         logger.info(f"Simulator loaded {len(self.registers)} register definitions")
 
-    def _normalize_registers(self, registers: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
-        """Normalize PLC-style 4xxxx addresses to datastore offsets when required."""
+    def _plc_address_base(self, registers: list[Dict[str, Any]]) -> int:
+        """Offset that maps PLC-style 4xxxx addresses to datastore offsets (0 if none)."""
         numeric_addrs = [
             int(r.get("address"))
             for r in registers
             if isinstance(r, dict) and isinstance(r.get("address"), (int, float))
         ]
         if not numeric_addrs:
-            return registers
+            return 0
 
         high_addr_ratio = sum(1 for a in numeric_addrs if a >= 40000) / len(numeric_addrs)
         if high_addr_ratio <= 0.5:
-            return registers
+            return 0
 
         base = 40001 if any(a >= 40001 for a in numeric_addrs) else 40000
-        normalized: list[Dict[str, Any]] = []
+        logger.info("Simulator converted PLC-style addresses to 0-based offsets using base %s", base)
+        return base
+
+    @staticmethod
+    def _compile_registers(registers: list[Dict[str, Any]], address_base: int = 0) -> list[RegisterPlan]:
+        """Resolve addresses, defaults, scaling and clamp bounds once per config load.
+
+        The register dicts are only read; PLC-style addresses are rebased into
+        the plans rather than into copies of the dicts.
+        """
+        plans: list[RegisterPlan] = []
         for reg in registers:
-            if not isinstance(reg, dict):
+            if not isinstance(reg, dict) or reg.get('address') is None:
                 continue
-            item = dict(reg)
-            addr = item.get("address")
-            if isinstance(addr, (int, float)) and addr >= base:
-                item["address"] = int(addr) - base
-            normalized.append(item)
-        logger.info("Simulator converted PLC-style addresses to 0-based offsets using base %s", base)
-        return normalized
+            address = int(reg['address'])
+            if address_base and address >= address_base:
+                address -= address_base
+            scale = reg.get('scale', 1.0) or 1.0
 
-    def get_simulated_value(self, reg: Dict[str, Any]) -> int:
-        """Generate a simulated value for a register."""
-        
-        # Handle static registers
-        if 'default' in reg and 'nominal' not in reg:
-            return int(reg['default'])
-        
-        # Get base value
-        nominal = reg.get('nominal', reg.get('default', 0))
-        if nominal is None:
-            nominal = reg.get('default', 0) or 0
+            # Static registers
+            if 'default' in reg and 'nominal' not in reg:
+                static_value = int(reg['default'] or 0)
+                if not 0 <= static_value <= 0xFFFF:
+                    logger.warning(
+                        "Register %s default %s does not fit in 16 bits; using its low word",
+                        reg.get('name', address), static_value,
+                    )
+                    static_value &= 0xFFFF
+                plans.append(RegisterPlan(address, static_value, 0, 0, scale, 0, 0, CAT_OTHER))
+                continue
+
+            nominal = reg.get('nominal', reg.get('default', 0))
+            if nominal is None:
+                nominal = reg.get('default', 0) or 0
+            noise = reg.get('noise', 0) or 0
+
+            min_val = reg.get('min', 0)
+            max_val = reg.get('max', 65535)
+            if min_val is None:
+                min_val = 0
+            if max_val is None:
+                max_val = 65535
+            # Integral bounds keep clamped values storable in the uint16 array (min: 0.5 is legal YAML)
+            min_raw = int(min_val / scale) if scale != 1.0 else int(min_val)
+            # Holding registers are uint16
+            max_raw = min(int(max_val / scale) if scale != 1.0 else int(max_val), 0xFFFF)
+
+            category = CATEGORY_CODES.get(reg.get('category'), CAT_OTHER)
+            plans.append(RegisterPlan(address, None, nominal, noise, scale, min_raw, max_raw, category))
 
-        noise = reg.get('noise', 0) or 0
-        scale = reg.get('scale', 1.0) or 1.0
-        trend_enabled = bool(self.simulation.get('trend_enabled', True))
-        noise_enabled = bool(self.simulation.get('noise_enabled', True))
+        # Stable sort so duplicate addresses keep their config order (last wins)
+        plans.sort(key=lambda p: p.address)
+        return plans
 
-        # Apply time-based trend
-        elapsed = time.time() - self.start_time
-        trend_factor = 1.0 + 0.01 * math.sin(elapsed / 300) if trend_enabled else 1.0
+    @staticmethod
+    def _build_runs(plans: list[RegisterPlan]) -> list[tuple[int, int, int]]:
+        """Group address-sorted plans into contiguous (address, start, end) runs."""
+        runs: list[tuple[int, int, int]] = []
+        start = 0
+        for i in range(1, len(plans) + 1):
+            if i == len(plans) or plans[i].address != plans[i - 1].address + 1:
+                runs.append((plans[start].address, start, i))
+                start = i
+        return runs
+
+    def _build_arrays(self, plans: list[RegisterPlan]):
+        """Build column arrays from the plans for the vectorized update."""
+        self._nominal_arr = np.asarray([p.nominal for p in plans], dtype=np.float64)
+        # Only registers with positive noise draw samples
+        noise = np.asarray([p.noise for p in plans], dtype=np.float64)
+        self._noise_dense = noise
+        self._noisy_idx = np.flatnonzero(noise > 0)
+        self._noise_arr = noise[self._noisy_idx]
+        self._noise_buf = np.empty(len(self._noisy_idx), dtype=np.float64)
+        self._scale_arr = np.asarray([p.scale for p in plans], dtype=np.float64)
+        self._min_arr = np.asarray([p.min_raw for p in plans], dtype=np.float64)
+        self._max_arr = np.asarray([p.max_raw for p in plans], dtype=np.float64)
+        self._cat_arr = np.asarray([p.category for p in plans], dtype=np.int8)
+        # Fixed values written over the computed ones while STOPPED
+        self._stopped_idx = np.flatnonzero(self._cat_arr & CAT_STOPPED_OVERRIDE)
+        self._stopped_vals = np.where(
+            self._cat_arr == CAT_AMBIENT_WHEN_STOPPED, np.trunc(80 / self._scale_arr), 0.0
+        )[self._stopped_idx]
+        self._out_buf = np.empty(len(plans), dtype=np.int64)
+
+    def _trend_factor(self) -> float:
+        """Time-based trend multiplier shared by every register this tick."""
+        if not self.trend_enabled:
+            return 1.0
+        elapsed = time.monotonic() - self.start_time
+        return 1.0 + 0.01 * math.sin(elapsed / 300)
+
+    def _compute_values(self, trend_factor: float) -> "np.ndarray":
+        """Vectorized get_simulated_value over every dynamic plan."""
+        if _compute_values_kernel is not None:
+            return _compute_values_kernel(
+                self._nominal_arr, self._noise_dense, self._scale_arr,
+                self._min_arr, self._max_arr, self._cat_arr,
+                self.engine_state == 0,
+                trend_factor, self.noise_enabled, self._out_buf,
+            )
+
+        vals = self._nominal_arr * trend_factor
+        if self.noise_enabled and len(self._noise_buf):
+            buf = self._rng.standard_normal(out=self._noise_buf)
+            buf *= self._noise_arr
+            vals[self._noisy_idx] += buf
+        vals /= self._scale_arr
+        np.trunc(vals, out=vals)
+        # Same order as the scalar clamp: max(min, min(max, v)), then >= 0
+        np.minimum(vals, self._max_arr, out=vals)
+        np.maximum(vals, self._min_arr, out=vals)
+        np.maximum(vals, 0, out=vals)
 
-        # Apply engine state effects
         if self.engine_state == 0:  # STOPPED
-            category = reg.get('category')
-            if category in ['engine', 'compressor', 'stage1', 'stage2', 'stage3']:
+            vals[self._stopped_idx] = self._stopped_vals
+
+        return vals.astype(np.int64)
+
+    def _bind_datastore(self, context: ModbusSlaveContext):
+        """Probe the holding-register list behind context for direct writes.
+
+        Sets ``_hr_values``/``_hr_offset`` so a register address maps to
+        ``_hr_values[address + _hr_offset]``, or leaves ``_hr_values`` as None
+        when the datastore layout is not recognized or a run is out of range.
+        """
+        self._bound_context = context
+        self._hr_values = None
+        self._hr_offset = 0
+        self._hr_typecode = None
+        try:
+            values = context.store['h'].values
+            # Write through the public API and see which slot moves
+            before = values[:4]
+            current = context.getValues(3, 0, 1)[0]
+            context.setValues(3, 0, [current ^ 1])
+            moved = [i for i in range(len(before)) if values[i] != before[i]]
+            context.setValues(3, 0, [current])
+        except Exception:
+            return
+        if len(moved) != 1:
+            return
+        offset = moved[0]
+        size = len(values)
+        if all(0 <= address + offset and address + offset + end - start <= size
+               for runs in (self._runs, self._static_runs)
+               for address, start, end in runs):
+            self._hr_values = values
+            self._hr_offset = offset
+            # Typed arrays only accept slices of the same type
+            self._hr_typecode = getattr(values, 'typecode', None)
+
+    def get_simulated_value(self, plan: RegisterPlan, trend_factor: Optional[float] = None) -> int:
+        """Generate a simulated value for a register.
+
+        ``trend_factor`` is normally computed once per tick by the caller.
+        """
+        _, static_value, nominal, noise, scale, min_raw, max_raw, category = plan
+
+        # Handle static registers
+        if static_value is not None:
+            return static_value
+
+        if trend_factor is None:
+            trend_factor = self._trend_factor()
+
+        # Apply engine state effects (most registers have no override)
+        if category and self.engine_state == 0:  # STOPPED
+            if category == CAT_ZERO_WHEN_STOPPED:
                 return 0
-            if category in ['exhaust', 'bearings']:
-                return int(80 / scale) # Ambient
+            return int(80 / scale) # Ambient
         
         # Calculate
         value = nominal * trend_factor
-        if noise_enabled and noise > 0:
+        if self.noise_enabled and noise > 0:
             value += random.gauss(0, noise)
         
         # Scale
         register_value = int(value / scale) if scale != 1.0 else int(value)
         
         # Clamp
-        min_val = reg.get('min', 0)
-        max_val = reg.get('max', 65535)
-        if min_val is None:
-            min_val = 0
-        if max_val is None:
-            max_val = 65535
-        register_value = max(int(min_val / scale) if scale != 1.0 else min_val,
-                            min(int(max_val / scale) if scale != 1.0 else max_val, register_value))
+        register_value = max(min_raw, min(max_raw, register_value))
         
         return max(0, register_value)
     
+    def offload_compute(self) -> bool:
+        """Whether the per-tick compute is large enough to be worth a worker thread."""
+        return np is not None and len(self.plans) >= OFFLOAD_MIN_REGISTERS
+
+    def compute_values(self) -> tuple[int, array.array]:
+        """Compute this tick's dynamic register values.
+
+        Touches only the simulator's own state, so it may run in a worker thread
+        (NumPy and the Numba kernel release the GIL). Returns the config
+        generation with the values so publish_values can drop stale results.
+        """
+        with self._lock:
+            trend_factor = self._trend_factor()
+            if np is not None:
+                raw = self._compute_values(trend_factor).astype(np.uint16).tobytes()
+                values = array.array('H')
+                values.frombytes(raw)
+            else:
+                get_value = self.get_simulated_value
+                values = array.array('H', [get_value(plan, trend_factor) for plan in self.plans])
+            return self._generation, values
+
+    def publish_values(self, context: ModbusSlaveContext, generation: int, values: array.array) -> bool:
+        """Write values from compute_values into the datastore; call on the server's loop."""
+        if generation != self._generation:
+            return False  # config reloaded while computing; runs no longer match
+
+        if context is not self._bound_context:
+            self._bind_datastore(context)
+            self._write_runs(context, self._static_runs, self._static_values)
+
+        self._write_runs(context, self._runs, values)
+        return True
+
     def update_registers(self, context: ModbusSlaveContext):
         """Update all simulated register values."""
-        
-        for reg in self.registers:
-            addr = reg['address']
-            value = self.get_simulated_value(reg)
-            
-            # Update the register (Holding Registers = 3)
-            # v3 context.setValues(fx, address, values)
+        return self.publish_values(context, *self.compute_values())
+
+    def _write_runs(self, context: ModbusSlaveContext, runs: list[tuple[int, int, int]], values: array.array):
+        """Write uint16 values into the holding registers, one slice per address run."""
+        hr_values = self._hr_values
+        if hr_values is not None:
+            # Addresses were range-checked at bind time
+            if self._hr_typecode != values.typecode:
+                # Plain lists only accept lists; other typed arrays need converting
+                values = values.tolist() if self._hr_typecode is None else array.array(self._hr_typecode, values)
+            offset = self._hr_offset
+            for address, start, end in runs:
+                index = address + offset
+                hr_values[index:index + end - start] = values[start:end]
+            return
+
+        # Fallback: one write per contiguous address run (Holding Registers = 3)
+        # v3 context.setValues(fx, address, values)
+        for address, start, end in runs:
             try:
-                context.setValues(3, addr, [value])
+                context.setValues(3, address, values[start:end].tolist())
             except Exception as e:
                 # Might happen if address is out of range of current datablock
                 pass
-        
-        return True
+
+
+def _config_cache_path(config_path: str) -> str:
+    """Parsed-config cache next to the YAML, e.g. config.yaml -> config.yaml.cache.json."""
+    return f"{config_path}.cache.json"
+
+
+def _read_config_cache(config_path: str, digest: str) -> Optional[Dict[str, Any]]:
+    """Return the cached config if it was built from YAML with this content hash."""
+    try:
+        with open(_config_cache_path(config_path), 'rb') as f:
+            raw = f.read()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get('hash') != digest:
+        return None
+    config = payload.get('data')
+    return config if isinstance(config, dict) else None
+
+
+def _write_config_cache(config_path: str, digest: str, config: Dict[str, Any]) -> None:
+    """Atomically write the cache; best effort (e.g. read-only mounts are skipped).
+
+    JSON only has string keys, so mappings like ``engine_states`` come back
+    keyed by strings; the simulator reads none of those.
+    """
+    payload = {'hash': digest, 'data': config}
+    cache_path = _config_cache_path(config_path)
+    try:
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(payload).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                # mkstemp creates 0600 files; keep the file readable on host-mounted dirs
+                os.fchmod(f.fileno(), 0o644)
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Config cache not written: {e}")
 
 
 class ModbusServer:
@@ -163,6 +572,9 @@ class ModbusServer:
     def __init__(self, config_path: str):
         self.config_path = config_path
         self.config_mtime = 0
+        # (mtime_ns, size, sha1, parsed) of the last successful parse
+        self._config_cache = None
+        self.skipped_ticks = 0
         
         # Initial load
         self.config = self._load_config()
@@ -170,16 +582,16 @@ class ModbusServer:
         self.server_config = self.config.get('server', {})
         self.sim_config = self.config.get('simulation', {})
         
-        # Create data store (larger to accommodate dynamic changes)
-        # Using 65536 to cover full range or reasonably large
-        self.store = ModbusSequentialDataBlock(0, [0] * 5000)
+        # Size holding registers to the highest configured address; the store
+        # grows on reload if the register map does. Coils/inputs are unused.
+        self.store = TypedDataBlock(0, self._holding_size())
         
         # Initialize Context (ModbusDeviceContext/ModbusSlaveContext)
         self.context = ModbusSlaveContext(
-            di=ModbusSequentialDataBlock(0, [0] * 5000),
-            co=ModbusSequentialDataBlock(0, [0] * 5000),
+            di=TypedDataBlock(0, UNUSED_BLOCK_SIZE, bits=True),
+            co=TypedDataBlock(0, UNUSED_BLOCK_SIZE, bits=True),
             hr=self.store,
-            ir=ModbusSequentialDataBlock(0, [0] * 5000),
+            ir=TypedDataBlock(0, UNUSED_BLOCK_SIZE),
         )
         
         # Initialize Server Context
@@ -194,23 +606,101 @@ class ModbusServer:
         # Initial update
         self.simulator.update_registers(self.context)
         
+    def _holding_size(self) -> int:
+        """Holding-register slots needed for the current register map."""
+        # +1 for the context's 1-based datablock addressing, +1 to include the last address
+        plans = self.simulator.plans + self.simulator.static_plans
+        return max((plan.address for plan in plans), default=0) + 2
+
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file."""
+        """Load configuration from YAML file.
+
+        Returns the previously parsed object when the file is unchanged, either
+        by (mtime, size) or, after a touch, by content hash. Fresh parses are
+        also served from a JSON cache file keyed by the content hash.
+        """
         try:
-            with open(self.config_path, 'r') as f:
-                config = yaml.safe_load(f) or {}
-                # Update mtime
-                try:
-                    self.config_mtime = os.path.getmtime(self.config_path)
-                except OSError:
-                    pass
-                return config
+            st = os.stat(self.config_path)
+            self.config_mtime = st.st_mtime
+            cache = self._config_cache
+            if cache is not None and cache[0] == st.st_mtime_ns and cache[1] == st.st_size:
+                return cache[3]
+
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
+            digest = hashlib.sha1(data).digest()
+            if cache is not None and cache[2] == digest:
+                self._config_cache = (st.st_mtime_ns, st.st_size, digest, cache[3])
+                return cache[3]
+
+            # A JSON cache stamped with the content hash skips YAML entirely
+            config = _read_config_cache(self.config_path, digest.hex())
+            if config is None:
+                # libyaml parses bytes directly, so skip the text decode
+                config = yaml.load(data, Loader=_Loader) or {}
+                if config:
+                    _write_config_cache(self.config_path, digest.hex(), config)
+            self._config_cache = (st.st_mtime_ns, st.st_size, digest, config)
+            return config
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             return {}
 
+    def _reload_if_changed(self) -> bool:
+        """Reload the config and simulator if the file content changed."""
+        new_config = self._load_config()
+        if not new_config or new_config is self.config:
+            return False
+        logger.info("Configuration change detected. Reloading...")
+        self.config = new_config
+        self.simulator.load_config(new_config)
+        self.store.grow(self._holding_size())
+        self.server_config = new_config.get('server', {})
+        self.sim_config = new_config.get('simulation', {})
+        logger.info(f"Configuration reloaded. Active Simulator Slave ID: {self.server_config.get('slave_id', 1)}")
+        return True
+
     async def watch_config(self):
         """Watch configuration file for changes."""
+        # SIM_CONFIG_WATCH=poll forces polling, e.g. for bind mounts that
+        # don't deliver inotify events
+        if awatch is not None and os.environ.get('SIM_CONFIG_WATCH', '').lower() != 'poll':
+            try:
+                await self._watch_config_events()
+                return
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"File watcher unavailable ({e}); falling back to polling")
+        await self._watch_config_poll()
+
+    async def _watch_config_events(self):
+        """Reload on filesystem events for the config file."""
+        # Watch the file itself: a single-file bind mount (docker-compose) only
+        # reports writes on the file, never on its parent directory.
+        logger.info(f"Watching {self.config_path} for changes")
+        while True:
+            if not os.path.exists(self.config_path):
+                await asyncio.sleep(2)
+                continue
+            inode = os.stat(self.config_path).st_ino
+            # Wake every 2 s without events for the mtime check, which catches
+            # changes the watch missed (e.g. rename-replace saves).
+            async for changes in awatch(self.config_path, rust_timeout=2000, yield_on_timeout=True):
+                try:
+                    if not os.path.exists(self.config_path):
+                        break
+                    st = os.stat(self.config_path)
+                    if changes or st.st_mtime > self.config_mtime:
+                        self._reload_if_changed()
+                    if st.st_ino != inode:
+                        # Replaced by rename; the watch still points at the old file
+                        break
+                except Exception as e:
+                    logger.error(f"Error watching config: {e}")
+
+    async def _watch_config_poll(self):
+        """Poll the config file mtime for changes."""
         while True:
             await asyncio.sleep(2) # Check every 2 seconds
             try:
@@ -219,28 +709,39 @@ class ModbusServer:
                     
                 current_mtime = os.path.getmtime(self.config_path)
                 if current_mtime > self.config_mtime:
-                    logger.info("Configuration change detected. Reloading...")
-                    self.config_mtime = current_mtime
-                    new_config = self._load_config()
-                    if new_config:
-                        self.config = new_config
-                        self.simulator.load_config(new_config)
-                        self.server_config = new_config.get('server', {})
-                        self.sim_config = new_config.get('simulation', {})
-                        logger.info(f"Configuration reloaded. Active Simulator Slave ID: {self.server_config.get('slave_id', 1)}")
+                    self._reload_if_changed()
             except Exception as e:
                 logger.error(f"Error watching config: {e}")
     
     async def update_loop(self):
         """Periodically update registers with simulated values."""
-        
+
+        loop = asyncio.get_running_loop()
+        # Tick against a monotonic schedule so update time doesn't stretch the interval
+        next_tick = time.monotonic()
         while True:
             # Use current interval
             interval_ms = self.sim_config.get('update_interval_ms', 100)
-            interval_s = interval_ms / 1000.0
+            interval_s = max(interval_ms, 1) / 1000.0
             
-            self.simulator.update_registers(self.context)
-            await asyncio.sleep(interval_s)
+            if self.simulator.offload_compute():
+                # Compute off the loop so large maps don't stall Modbus requests;
+                # the datastore itself is only written from the loop
+                computed = await loop.run_in_executor(None, self.simulator.compute_values)
+                self.simulator.publish_values(self.context, *computed)
+            else:
+                self.simulator.update_registers(self.context)
+
+            next_tick += interval_s
+            delay = next_tick - time.monotonic()
+            if delay < 0:
+                # Fell behind: skip the missed ticks rather than catching up in a burst
+                missed = math.ceil(-delay / interval_s)
+                next_tick += missed * interval_s
+                delay = max(0.0, next_tick - time.monotonic())
+                self.skipped_ticks += missed
+                logger.warning(f"Register update overran {interval_ms} ms interval; skipped {missed} tick(s)")
+            await asyncio.sleep(delay)
     
     async def run(self, host: str = None, port: int = None):
         """Start the Modbus TCP server."""
@@ -255,10 +756,10 @@ class ModbusServer:
         watch_task = asyncio.create_task(self.watch_config())
         
         try:
-            await StartAsyncTcpServer(
-                context=self.server_context,
+            await NoDelayTcpServer(
+                self.server_context,
                 address=(host, port),
-            )
+            ).serve_forever()
         except asyncio.CancelledError:
             logger.info("Server shutting down...")
         finally:
@@ -281,8 +782,10 @@ def main():
     # Note: args.config will point to the mounted path
     server = ModbusServer(args.config)
     
+    run = uvloop.run if uvloop is not None else asyncio.run
+    logger.info(f"Event loop: {'uvloop' if uvloop is not None else 'asyncio'}")
     try:
-        asyncio.run(server.run(args.host, args.port))
+        run(server.run(args.host, args.port))
     except KeyboardInterrupt:
         logger.info("Stopped by user")
     